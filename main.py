@@ -1,24 +1,42 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from src.api import utils, contacts, auth, users
+from src.services.email import drain_email_queue, email_worker
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    worker = asyncio.create_task(email_worker())
+    yield
+    await drain_email_queue()
+    worker.cancel()
+    with suppress(asyncio.CancelledError):
+        await worker
 
 
-app = FastAPI()
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
-origins = ["<http://localhost:3000>", "http://localhost:8000"]
+origins = ["http://localhost:3000", "http://localhost:8000"]
+methods = ["GET", "POST", "PATCH", "DELETE"]
+headers = ["Authorization", "Content-Type"]
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=methods,
+    allow_headers=headers,
 )
 
 
 app.include_router(utils.router, prefix="/api")
 app.include_router(contacts.router, prefix="/api")
+app.include_router(auth.public_router, prefix="/api")
 app.include_router(auth.router, prefix="/api")
 app.include_router(users.router, prefix="/api")
 
@@ -26,4 +44,14 @@ app.include_router(users.router, prefix="/api")
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    from src.conf.config import settings
+
+    uvicorn.run(
+        "main:app",
+        host="127.0.0.1",
+        port=8000,
+        reload=settings.UVICORN_RELOAD,
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+    )
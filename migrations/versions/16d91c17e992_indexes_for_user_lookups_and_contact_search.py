@@ -0,0 +1,42 @@
+"""Indexes for user lookups and contact search
+
+Revision ID: 16d91c17e992
+Revises: 0ed0b5406f7d
+Create Date: 2026-10-14 10:12:31.418205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '16d91c17e992'
+down_revision: Union[str, Sequence[str], None] = '0ed0b5406f7d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_users_username'), 'users', ['username'], unique=False)
+    # Unique, because email lookups match on lower(email). Before upgrading,
+    # merge or rename accounts whose emails differ only by case, or this fails:
+    #   SELECT lower(email), array_agg(id) FROM users
+    #   GROUP BY lower(email) HAVING count(*) > 1;
+    op.create_index('users_email_lower_idx', 'users', [sa.text('lower(email)')], unique=True)
+    op.create_index(op.f('ix_contacts_user_id'), 'contacts', ['user_id'], unique=False)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute(
+        "CREATE INDEX contacts_search_trgm ON contacts USING gin "
+        "((first_name || ' ' || last_name || ' ' || email) gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('contacts_search_trgm', table_name='contacts')
+    op.drop_index(op.f('ix_contacts_user_id'), table_name='contacts')
+    op.drop_index('users_email_lower_idx', table_name='users')
+    op.drop_index(op.f('ix_users_username'), table_name='users')
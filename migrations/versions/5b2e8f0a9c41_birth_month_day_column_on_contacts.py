@@ -0,0 +1,30 @@
+"""Birth month/day column on contacts
+
+Revision ID: 5b2e8f0a9c41
+Revises: 16d91c17e992
+Create Date: 2026-10-14 10:48:05.562817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b2e8f0a9c41'
+down_revision: Union[str, Sequence[str], None] = '16d91c17e992'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('contacts', sa.Column('birth_md', sa.Integer(), sa.Computed('CAST(EXTRACT(month FROM birth_date) * 100 + EXTRACT(day FROM birth_date) AS INTEGER)', persisted=True), nullable=False))
+    op.create_index(op.f('ix_contacts_birth_md'), 'contacts', ['birth_md'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_contacts_birth_md'), table_name='contacts')
+    op.drop_column('contacts', 'birth_md')
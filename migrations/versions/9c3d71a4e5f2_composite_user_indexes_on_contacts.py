@@ -0,0 +1,34 @@
+"""Composite user indexes on contacts
+
+Revision ID: 9c3d71a4e5f2
+Revises: 5b2e8f0a9c41
+Create Date: 2026-10-14 11:20:44.107392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3d71a4e5f2'
+down_revision: Union[str, Sequence[str], None] = '5b2e8f0a9c41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_contacts_user_id_id', 'contacts', ['user_id', 'id'], unique=False)
+    op.create_index('ix_contacts_user_id_birth_md', 'contacts', ['user_id', 'birth_md'], unique=False)
+    op.drop_index(op.f('ix_contacts_user_id'), table_name='contacts')
+    op.drop_index(op.f('ix_contacts_birth_md'), table_name='contacts')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_contacts_birth_md'), 'contacts', ['birth_md'], unique=False)
+    op.create_index(op.f('ix_contacts_user_id'), 'contacts', ['user_id'], unique=False)
+    op.drop_index('ix_contacts_user_id_birth_md', table_name='contacts')
+    op.drop_index('ix_contacts_user_id_id', table_name='contacts')
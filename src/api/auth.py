@@ -1,29 +1,33 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
-from src.services.email import send_email
+from src.services.email import enqueue_email
 from src.services.auth import (
-    Hash,
     create_access_token,
     create_refresh_token,
     get_current_admin_user,
     get_email_from_token,
+    get_password_hash,
+    verify_password,
     verify_refresh_token,
 )
+from src.api.users import limiter
 from src.schemas import RequestEmail, Token, TokenRefreshRequest, UserCreate, UserModel
 from src.services.users import UserService
 from src.database.db import get_db
 
 
 router = APIRouter(prefix="/auth", tags=["auth"])
+# Routes that never need the current user; kept apart so router-level
+# auth dependencies added to ``router`` do not apply to them.
+public_router = APIRouter(prefix="/auth", tags=["auth-public"])
 
 
 @router.post("/register", response_model=UserModel, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserCreate,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> UserModel:
@@ -32,7 +36,6 @@ async def register_user(
 
     Args:
         user_data (UserCreate): The data for the new user.
-        background_tasks (BackgroundTasks): Background tasks to run after the response.
         request (Request): The request object to get the base URL for email confirmation.
         db (AsyncSession): The database session dependency.
 
@@ -42,19 +45,18 @@ async def register_user(
 
     user_service = UserService(db)
 
-    user_by_email = await user_service.get_user_by_email(user_data.email)
-    user_by_username = await user_service.get_user_by_username(user_data.username)
-    if user_by_username or user_by_email:
+    existing_user = await user_service.get_user_by_email_or_username(
+        user_data.email, user_data.username
+    )
+    if existing_user:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="User already exists",
         )
 
-    user_data.password = Hash().get_password_hash(user_data.password)
+    user_data.password = await get_password_hash(user_data.password)
     new_user = await user_service.create_user(user_data)
-    background_tasks.add_task(
-        send_email, new_user.email, new_user.username, request.base_url
-    )
+    enqueue_email(new_user.email, new_user.username, request.base_url)
 
     return new_user
 
@@ -77,7 +79,9 @@ async def login_user(
     user_service = UserService(db)
 
     user = await user_service.get_user_by_username(form_data.username)
-    if not user or not Hash().verify_password(form_data.password, user.hashed_password):
+    if not user or not await verify_password(
+        form_data.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid credentials",
@@ -151,14 +155,14 @@ async def confirmed_email(token: str, db: AsyncSession = Depends(get_db)) -> dic
         )
     if user.is_confirmed:
         return {"message": "Email already confirmed"}
-    await user_service.confirmed_email(email)
+    await user_service.confirm_email(email)
     return {"message": "Email confirmed"}
 
 
-@router.post("/request_email")
+@router.post("/request_email", description="No more than 3 requests per minute")
+@limiter.limit("3/minute")
 async def request_email(
     body: RequestEmail,
-    background_tasks: BackgroundTasks,
     request: Request,
     db: AsyncSession = Depends(get_db),
 ) -> dict:
@@ -167,7 +171,6 @@ async def request_email(
 
     Args:
         body (RequestEmail): The request body containing the user's email.
-        background_tasks (BackgroundTasks): Background tasks to run after the response.
         request (Request): The request object to get the base URL for email confirmation.
         db (AsyncSession): The database session dependency.
 
@@ -178,16 +181,15 @@ async def request_email(
     user_service = UserService(db)
     user = await user_service.get_user_by_email(body.email)
 
+    if user is None:
+        return {"message": "Check your email for confirmation link"}
     if user.is_confirmed:
         return {"message": "Email already confirmed"}
-    if user:
-        background_tasks.add_task(
-            send_email, user.email, user.username, request.base_url
-        )
+    enqueue_email(user.email, user.username, request.base_url)
     return {"message": "Check your email for confirmation link"}
 
 
-@router.get("/public")
+@public_router.get("/public")
 def read_public():
     return {"message": "This is a public route accessible to everyone"}
 
@@ -1,40 +1,68 @@
 from typing import List
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models import User
 from src.services.auth import get_current_user
 from src.database.db import get_db
-from src.schemas import ContactResponse, ContactModel
+from src.schemas import ContactListAdapter, ContactResponse, ContactModel
 from src.services.contacts import ContactsService
 
 
-router = APIRouter(prefix="/contacts", tags=["contacts"])
+router = APIRouter(
+    prefix="/contacts",
+    tags=["contacts"],
+    dependencies=[Depends(get_current_user)],
+)
 
+# List routes skip response_model so FastAPI doesn't validate its output a
+# second time; this keeps the schema in the OpenAPI docs.
+_list_responses = {status.HTTP_200_OK: {"model": List[ContactResponse]}}
 
-@router.get("/", response_model=List[ContactResponse])
+
+def _contacts_response(contacts) -> Response:
+    """
+    Serialize contacts straight into a JSON response.
+
+    Args:
+        contacts: The contacts loaded from the database.
+
+    Returns:
+        Response: The JSON list of contacts.
+    """
+
+    validated = ContactListAdapter.validate_python(contacts, from_attributes=True)
+    return Response(
+        content=ContactListAdapter.dump_json(validated), media_type="application/json"
+    )
+
+
+@router.get("/", responses=_list_responses)
 async def read_contacts(
-    skip: int = 0,
+    skip: int = Query(0, deprecated=True),
     limit: int = 100,
+    cursor: int | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
-) -> List[ContactResponse]:
+) -> Response:
     """
     Retrieve a list of contacts for the authenticated user.
 
     Args:
-        skip (int): Number of contacts to skip for pagination.
+        skip (int): Number of contacts to skip; deprecated in favour of cursor.
         limit (int): Maximum number of contacts to return.
+        cursor (int | None): The last contact ID of the previous page.
         db (AsyncSession): The database session dependency.
         user (User): The authenticated user.
 
     Returns:
-        List[ContactResponse]: A list of contacts for the user.
+        Response: A list of contacts for the user.
     """
 
     contacts_service = ContactsService(db)
-    contacts = await contacts_service.get_contacts(user, skip, limit)
-    return contacts
+    contacts = await contacts_service.get_contacts(user, skip, limit, cursor)
+    return _contacts_response(contacts)
 
 
 @router.get("/{contact_id}", response_model=ContactResponse)
@@ -64,37 +92,41 @@ async def read_contact(
     return contact
 
 
-@router.get("/search/")
+@router.get("/search/", responses=_list_responses)
 async def search_contacts(
     query: str,
+    limit: int = Query(50, ge=1, le=100),
+    cursor: int | None = None,
     db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
-) -> List[ContactResponse]:
+) -> Response:
     """
     Search for contacts by a query string.
 
     Args:
         query (str): The search query string.
+        limit (int): Maximum number of contacts to return.
+        cursor (int | None): The last contact ID of the previous page.
         db (AsyncSession): The database session dependency.
         user (User): The authenticated user.
 
     Returns:
-        List[ContactResponse]: A list of contacts matching the search query.
+        Response: A list of contacts matching the search query.
     """
 
     contacts_service = ContactsService(db)
-    contacts = await contacts_service.search_contacts(user, query)
+    contacts = await contacts_service.search_contacts(user, query, limit, cursor)
     if not contacts:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contacts not found"
         )
-    return contacts
+    return _contacts_response(contacts)
 
 
-@router.get("/birthdays/", response_model=List[ContactResponse])
+@router.get("/birthdays/", responses=_list_responses)
 async def get_birthdays_next_week(
     db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
-) -> List[ContactResponse]:
+) -> Response:
     """
     List contacts with birthdays in the next week.
 
@@ -103,7 +135,7 @@ async def get_birthdays_next_week(
         user (User): The authenticated user.
 
     Returns:
-        List[ContactResponse]: A list of contacts with birthdays in the next week.
+        Response: A list of contacts with birthdays in the next week.
     """
     contacts_service = ContactsService(db)
     contacts = await contacts_service.get_birthdays_next_week(user)
@@ -111,7 +143,7 @@ async def get_birthdays_next_week(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Contacts not found"
         )
-    return contacts
+    return _contacts_response(contacts)
 
 
 @router.post("/", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
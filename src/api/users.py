@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, File, Request, UploadFile
+from fastapi import APIRouter, Depends, File, HTTPException, Request, UploadFile, status
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -55,7 +55,7 @@ async def update_avatar_user(
         UserModel: The user with the updated avatar URL.
     """
 
-    avatar_url = UploadFileService(
+    avatar_url = await UploadFileService(
         settings.CLOUDINARY_NAME,
         settings.CLOUDINARY_API_KEY,
         settings.CLOUDINARY_API_SECRET,
@@ -63,5 +63,9 @@ async def update_avatar_user(
 
     user_service = UserService(db)
     user = await user_service.update_avatar_url(user.email, avatar_url)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
+        )
 
     return user
@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
@@ -7,12 +10,53 @@ from src.database.db import get_db
 
 router = APIRouter(tags=["utils"])
 
+HEALTH_CACHE_TTL_SECONDS = 5
+
+_health_lock = asyncio.Lock()
+# (monotonic time of the last check, error detail or None when healthy)
+_last_health_check: tuple[float, str | None] = (float("-inf"), None)
+
+
+async def _check_database(db: AsyncSession) -> str | None:
+    """
+    Run ``SELECT 1`` at most once per HEALTH_CACHE_TTL_SECONDS.
+
+    The session only checks out a pool connection when a query is executed,
+    so probes served from the cached result never touch the pool.
+
+    Args:
+        db (AsyncSession): The database session dependency.
+
+    Returns:
+        str | None: The error detail if the database is unhealthy, otherwise None.
+    """
+    global _last_health_check
+
+    async with _health_lock:
+        checked_at, error = _last_health_check
+        if time.monotonic() - checked_at < HEALTH_CACHE_TTL_SECONDS:
+            return error
+
+        try:
+            result = await db.execute(text("SELECT 1"))
+            result = result.scalar_one_or_none()
+            error = "Database is not configured correctly" if result is None else None
+        except Exception as e:
+            print(e)
+            error = "Error connecting to the database"
+
+        _last_health_check = (time.monotonic(), error)
+        return error
+
 
 @router.get("/healthchecker")
 async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
     """
     Health check endpoint to verify if the database is configured correctly.
 
+    The database result is cached for a few seconds, so frequent probes
+    do not take connections away from user requests.
+
     Args:
         db (AsyncSession): The database session dependency.
 
@@ -20,19 +64,10 @@ async def healthchecker(db: AsyncSession = Depends(get_db)) -> dict:
         dict: A message indicating the health status of the application.
     """
 
-    try:
-        result = await db.execute(text("SELECT 1"))
-        result = result.scalar_one_or_none()
-
-        if result is None:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Database is not configured correctly",
-            )
-        return {"message": "Welcome to FastAPI!"}
-    except Exception as e:
-        print(e)
+    error = await _check_database(db)
+    if error is not None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Error connecting to the database",
+            detail=error,
         )
+    return {"message": "Welcome to FastAPI!"}
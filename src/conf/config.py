@@ -3,9 +3,16 @@ from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
+    UVICORN_RELOAD: bool = False
+
     DB_URL: str = (
         "postgresql+asyncpg://POSTGRES_USER:POSTGRES_PASSWORD@$POSTGRES_HOST:1234/POSTGRES_DB"
     )
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+
     JWT_SECRET: str = "None"
     JWT_ALGORITHM: str = "HS256"
     JWT_EXPIRATION_SECONDS: int = 3600
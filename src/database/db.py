@@ -5,15 +5,28 @@ from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.conf.config import settings
 
 
 class DatabaseSessionManager:
     def __init__(self, url: str):
-        self._engine: AsyncEngine | None = create_async_engine(url)
+        self._engine: AsyncEngine | None = create_async_engine(
+            url,
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=True,
+            connect_args={
+                "statement_cache_size": 1024,
+                "prepared_statement_cache_size": 256,
+            },
+        )
         self._session_maker: async_sessionmaker = async_sessionmaker(
-            autoflush=False, autocommit=False, bind=self._engine
+            autoflush=False, autocommit=False, expire_on_commit=False, bind=self._engine
         )
 
     @contextlib.asynccontextmanager
@@ -34,5 +47,16 @@ sessionmanager = DatabaseSessionManager(settings.DB_URL)
 
 
 async def get_db():
+    """
+    Provide a database session for the current request.
+
+    FastAPI caches dependency results per request, so every dependency that
+    asks for ``get_db`` (e.g. ``get_current_user`` and the route itself) gets
+    this same session, opened once and closed when the response is done.
+
+    Yields:
+        AsyncSession: The request-scoped database session.
+    """
+
     async with sessionmanager.session() as session:
         yield session
@@ -1,5 +1,18 @@
 from datetime import datetime
-from sqlalchemy import Boolean, Column, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Computed,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    cast,
+    extract,
+    func,
+    literal_column,
+)
 from sqlalchemy.orm import mapped_column, Mapped, DeclarativeBase, relationship
 from sqlalchemy.sql.sqltypes import DateTime
 
@@ -19,6 +32,7 @@ class Contact(Base):
         email (str): The email address of the contact.
         phone (str): The phone number of the contact.
         birth_date (datetime): The birth date of the contact.
+        birth_md (int): The MMDD of birth_date, generated by the database.
         description (Optional[str]): A description of the contact.
         user_id (int): The ID of the user who owns this contact.
     """
@@ -30,14 +44,52 @@ class Contact(Base):
     email: Mapped[str] = mapped_column(String(100), nullable=False)
     phone: Mapped[str] = mapped_column(String(20), nullable=False)
     birth_date: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    birth_md: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            cast(
+                extract("month", birth_date.column) * 100
+                + extract("day", birth_date.column),
+                Integer,
+            ),
+            persisted=True,
+        ),
+    )
     description: Mapped[str] = mapped_column(String(150), nullable=True)
 
     user_id = Column(
-        "user_id", ForeignKey("users.id", ondelete="CASCADE"), default=None
+        "user_id",
+        ForeignKey("users.id", ondelete="CASCADE"),
+        default=None,
     )
     user = relationship("User", backref="contacts")
 
 
+# Every contact query is scoped to one user, so lead with user_id: (user_id, id)
+# serves lookups by id and id-ordered pagination, (user_id, birth_md) the
+# birthday window range scan.
+Index("ix_contacts_user_id_id", Contact.user_id, Contact.id)
+Index("ix_contacts_user_id_birth_md", Contact.user_id, Contact.birth_md)
+
+
+# Full-text haystack for contact search; the repository filters on this exact
+# expression so Postgres can answer ILIKE '%...%' from the trigram index.
+contact_search_text = (
+    Contact.first_name
+    + literal_column("' '")
+    + Contact.last_name
+    + literal_column("' '")
+    + Contact.email
+).label("search_text")
+
+Index(
+    "contacts_search_trgm",
+    contact_search_text,
+    postgresql_using="gin",
+    postgresql_ops={"search_text": "gin_trgm_ops"},
+)
+
+
 class UserRole(str, Enum):
     USER = "user"
     ADMIN = "admin"
@@ -59,9 +111,13 @@ class User(Base):
     __tablename__ = "users"
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     email: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
-    username: Mapped[str] = mapped_column(String(30), nullable=False)
+    username: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
     hashed_password: Mapped[str] = mapped_column(String(255), nullable=False)
     is_confirmed: Mapped[bool] = mapped_column(Boolean, default=False)
     avatar: Mapped[str] = mapped_column(String(255), nullable=True)
     role: Mapped[str] = mapped_column(String(8), nullable=False, default=UserRole.USER)
     refresh_token: Mapped[str] = mapped_column(String(255), nullable=True)
+
+
+# Lookups match on lower(email), so uniqueness has to hold case-insensitively too
+Index("users_email_lower_idx", func.lower(User.email), unique=True)
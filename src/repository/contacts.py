@@ -5,13 +5,20 @@ This module provides a repository for managing contact-related database operatio
 
 from datetime import datetime, timedelta
 from typing import List
-from sqlalchemy import select
+from sqlalchemy import delete, insert, lambda_stmt, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, raiseload
 
-from src.database.models import Contact, User
+from src.database.models import Contact, User, contact_search_text
 from src.schemas import ContactModel
 
 
+def _contains_pattern(query: str) -> str:
+    """Build an ILIKE pattern matching ``query`` literally anywhere in the text."""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
 class ContactsRepository:
     def __init__(self, session: AsyncSession):
         """
@@ -22,20 +29,48 @@ class ContactsRepository:
         """
         self.db = session
 
-    async def get_contacts(self, user: User, skip: int, limit: int) -> List[Contact]:
+    async def get_contacts(
+        self, user: User, skip: int, limit: int, cursor: int | None = None
+    ) -> List[Contact]:
         """
         Retrieve a list of contacts for the specified user with pagination.
 
+        Contacts are ordered by ID. Passing the last ID of the previous page as
+        ``cursor`` seeks straight to the next page instead of skipping rows.
+
         Args:
             user (User): The user for whom to retrieve contacts.
-            skip (int): Number of contacts to skip for pagination.
+            skip (int): Number of contacts to skip; ignored when cursor is given.
             limit (int): Maximum number of contacts to return.
+            cursor (int | None): Return only contacts with an ID greater than this.
 
         Returns:
             List[Contact]: A list of contacts for the user.
         """
 
-        stmt = select(Contact).filter_by(user=user).offset(skip).limit(limit)
+        user_id = user.id
+        stmt = lambda_stmt(
+            lambda: select(Contact)
+            .options(
+                load_only(
+                    Contact.id,
+                    Contact.first_name,
+                    Contact.last_name,
+                    Contact.email,
+                    Contact.phone,
+                    Contact.birth_date,
+                    Contact.description,
+                ),
+                raiseload("*"),
+            )
+            .where(Contact.user_id == user_id)
+            .order_by(Contact.id)
+        )
+        if cursor is not None:
+            stmt += lambda s: s.where(Contact.id > cursor)
+        else:
+            stmt += lambda s: s.offset(skip)
+        stmt += lambda s: s.limit(limit)
         contacts = await self.db.execute(stmt)
         return contacts.scalars().all()
 
@@ -51,31 +86,35 @@ class ContactsRepository:
             Contact | None: The contact with the specified ID, or None if not found.
         """
 
-        stmt = select(Contact).filter_by(user=user, id=contact_id)
-        contact = await self.db.execute(stmt)
-        return contact.scalar_one_or_none()
+        contact = await self.db.get(Contact, contact_id)
+        if contact is None or contact.user_id != user.id:
+            return None
+        return contact
 
-    async def search_contacts(self, user: User, query: str) -> List[Contact]:
+    async def search_contacts(
+        self, user: User, query: str, limit: int = 50, cursor: int | None = None
+    ) -> List[Contact]:
         """
         Search for contacts by first name, last name, or email for the specified user.
 
         Args:
             user (User): The user for whom to search contacts.
             query (str): The search query to match against first name, last name, or email.
+            limit (int): Maximum number of contacts to return.
+            cursor (int | None): Return only contacts with an ID greater than this.
 
         Returns:
-            List[Contact]: A list of contacts matching the search query.
+            List[Contact]: A list of matching contacts, ordered by ID.
         """
 
         stmt = (
             select(Contact)
-            .filter_by(user=user)
-            .filter(
-                (Contact.first_name.ilike(f"%{query}%"))
-                | (Contact.last_name.ilike(f"%{query}%"))
-                | (Contact.email.ilike(f"%{query}%"))
-            )
+            .where(Contact.user_id == user.id)
+            .filter(contact_search_text.ilike(_contains_pattern(query), escape="\\"))
         )
+        if cursor is not None:
+            stmt = stmt.where(Contact.id > cursor)
+        stmt = stmt.order_by(Contact.id).limit(limit)
         contacts = await self.db.execute(stmt)
         return contacts.scalars().all()
 
@@ -92,11 +131,14 @@ class ContactsRepository:
 
         today = datetime.now().date()
         next_week = today + timedelta(days=7)
-        stmt = (
-            select(Contact)
-            .filter_by(user=user)
-            .filter(Contact.birth_date.between(today, next_week))
-        )
+        start = today.month * 100 + today.day
+        end = next_week.month * 100 + next_week.day
+        if start <= end:
+            window = Contact.birth_md.between(start, end)
+        else:
+            # The week wraps past December 31st.
+            window = or_(Contact.birth_md >= start, Contact.birth_md <= end)
+        stmt = select(Contact).where(Contact.user_id == user.id, window)
         contacts = await self.db.execute(stmt)
         return contacts.scalars().all()
 
@@ -118,6 +160,29 @@ class ContactsRepository:
         await self.db.refresh(contact)
         return contact
 
+    async def create_contacts(
+        self, user: User, bodies: List[ContactModel]
+    ) -> List[Contact]:
+        """
+        Create several contacts for the specified user in one INSERT.
+
+        Args:
+            user (User): The user for whom to create the contacts.
+            bodies (List[ContactModel]): The contact data to create.
+
+        Returns:
+            List[Contact]: The newly created contacts, in the order given.
+        """
+
+        if not bodies:
+            return []
+        values = [{**body.model_dump(), "user_id": user.id} for body in bodies]
+        stmt = insert(Contact).returning(Contact, sort_by_parameter_order=True)
+        contacts = await self.db.scalars(stmt, values)
+        contacts = contacts.all()
+        await self.db.commit()
+        return contacts
+
     async def update_contact(
         self, user: User, contact_id: int, body: ContactModel
     ) -> Contact | None:
@@ -133,13 +198,15 @@ class ContactsRepository:
             Contact | None: The updated contact, or None if not found.
         """
 
-        contact = await self.get_contact_by_id(user, contact_id)
-        if contact:
-            for key, value in body.model_dump(exclude_unset=True).items():
-                setattr(contact, key, value)
-
-            await self.db.commit()
-            await self.db.refresh(contact)
+        stmt = (
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .values(**body.model_dump(exclude_unset=True))
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
 
     async def remove_contact(self, user: User, contact_id: int) -> Contact | None:
@@ -154,8 +221,12 @@ class ContactsRepository:
             Contact | None: The removed contact, or None if not found.
         """
 
-        contact = await self.get_contact_by_id(user, contact_id)
-        if contact:
-            await self.db.delete(contact)
-            await self.db.commit()
+        stmt = (
+            delete(Contact)
+            .where(Contact.id == contact_id, Contact.user_id == user.id)
+            .returning(Contact)
+        )
+        result = await self.db.execute(stmt)
+        contact = result.scalar_one_or_none()
+        await self.db.commit()
         return contact
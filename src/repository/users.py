@@ -3,13 +3,18 @@ Repository for managing user-related database operations.
 """
 
 from pydantic import EmailStr
-from sqlalchemy import select
+from sqlalchemy import func, lambda_stmt, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, make_transient_to_detached
 
 from src.database.models import User
 from src.schemas import UserCreate
 
 
+# Columns needed to authenticate a request and render the current user.
+AUTH_USER_COLUMNS = (User.id, User.username, User.email, User.role, User.is_confirmed)
+
+
 class UsersRepository:
     def __init__(self, session: AsyncSession):
         """
@@ -52,13 +57,13 @@ class UsersRepository:
             User | None: The user object if found, otherwise None.
         """
 
-        stmt = select(User).filter_by(id=user_id)
+        stmt = lambda_stmt(lambda: select(User).where(User.id == user_id))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
     async def get_user_by_email(self, email: EmailStr) -> User | None:
         """
-        Retrieve a user by their email address.
+        Retrieve a user by their email address, ignoring case.
 
         Args:
             email (EmailStr): The email address of the user to retrieve.
@@ -67,7 +72,8 @@ class UsersRepository:
             User | None: The user object if found, otherwise None.
         """
 
-        stmt = select(User).filter_by(email=email)
+        email = email.lower()
+        stmt = lambda_stmt(lambda: select(User).where(func.lower(User.email) == email))
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
@@ -82,11 +88,74 @@ class UsersRepository:
             User | None: The user object if found, otherwise None.
         """
 
-        stmt = select(User).filter_by(username=username)
+        stmt = lambda_stmt(lambda: select(User).where(User.username == username))
+        user = await self.db.execute(stmt)
+        return user.scalar_one_or_none()
+
+    async def get_user_auth_projection(self, username: str) -> User | None:
+        """
+        Retrieve a user by their username, loading only AUTH_USER_COLUMNS.
+
+        Other attributes are left unloaded, so this is meant for the
+        per-request authentication lookup only.
+
+        Args:
+            username (str): The username of the user to retrieve.
+
+        Returns:
+            User | None: The partially loaded user object if found, otherwise None.
+        """
+
+        stmt = lambda_stmt(
+            lambda: select(User)
+            .options(load_only(*AUTH_USER_COLUMNS))
+            .where(User.username == username)
+        )
         user = await self.db.execute(stmt)
         return user.scalar_one_or_none()
 
-    async def confirm_email(self, email: str) -> None:
+    async def attach_cached_user(self, values: dict) -> User:
+        """
+        Rebuild a user from cached AUTH_USER_COLUMNS values without a query.
+
+        The user is merged into the session as if it had been loaded by
+        get_user_auth_projection, with the other attributes left unloaded.
+
+        Args:
+            values (dict): The AUTH_USER_COLUMNS values, keyed by attribute name.
+
+        Returns:
+            User: The partially loaded user object, attached to the session.
+        """
+
+        user = User(**values)
+        make_transient_to_detached(user)
+        return await self.db.merge(user, load=False)
+
+    async def get_user_by_email_or_username(
+        self, email: EmailStr, username: str
+    ) -> User | None:
+        """
+        Retrieve a user matching either the email address or the username.
+
+        Args:
+            email (EmailStr): The email address to match.
+            username (str): The username to match.
+
+        Returns:
+            User | None: The first matching user object if found, otherwise None.
+        """
+
+        email = email.lower()
+        stmt = lambda_stmt(
+            lambda: select(User)
+            .where(or_(func.lower(User.email) == email, User.username == username))
+            .limit(1)
+        )
+        user = await self.db.execute(stmt)
+        return user.scalar_one_or_none()
+
+    async def confirm_email(self, email: str) -> User | None:
         """
         Confirm a user's email address.
 
@@ -94,14 +163,21 @@ class UsersRepository:
             email (str): The email address of the user to confirm.
 
         Returns:
-            None
+            User | None: The confirmed user object, or None if not found.
         """
 
-        user = await self.get_user_by_email(email)
-        user.is_confirmed = True
+        stmt = (
+            update(User)
+            .where(func.lower(User.email) == email.lower())
+            .values(is_confirmed=True)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
         await self.db.commit()
+        return user
 
-    async def update_avatar_url(self, email: str, url: str) -> User:
+    async def update_avatar_url(self, email: str, url: str) -> User | None:
         """
         Update the avatar URL for a user.
 
@@ -110,11 +186,16 @@ class UsersRepository:
             url (str): The new avatar URL.
 
         Returns:
-            User: The updated user object with the new avatar URL.
+            User | None: The updated user object, or None if not found.
         """
 
-        user = await self.get_user_by_email(email)
-        user.avatar = url
+        stmt = (
+            update(User)
+            .where(func.lower(User.email) == email.lower())
+            .values(avatar=url)
+            .returning(User)
+        )
+        result = await self.db.execute(stmt)
+        user = result.scalar_one_or_none()
         await self.db.commit()
-        await self.db.refresh(user)
         return user
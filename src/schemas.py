@@ -1,12 +1,25 @@
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    Field,
+    StringConstraints,
+    TypeAdapter,
+)
 from datetime import date
-from typing import Optional
+from typing import Annotated, List, Optional
+
+
+# Cheap shape check for contact emails; EmailStr's email-validator parse is
+# kept for user accounts, where addresses are actually mailed.
+_EMAIL_PATTERN = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+ContactEmail = Annotated[str, StringConstraints(pattern=_EMAIL_PATTERN, max_length=100)]
 
 
 class ContactModel(BaseModel):
     first_name: str
     last_name: Optional[str] = Field(default=None, max_length=30)
-    email: EmailStr
+    email: ContactEmail
     phone: Optional[str] = Field(default=None, max_length=12)
     birth_date: Optional[date] = Field(default=None)
     description: Optional[str] = None
@@ -18,6 +31,10 @@ class ContactResponse(ContactModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+# Validates and serializes whole contact lists in one pass through pydantic-core.
+ContactListAdapter = TypeAdapter(List[ContactResponse])
+
+
 class UserModel(BaseModel):
     id: int
     email: EmailStr
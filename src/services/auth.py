@@ -1,11 +1,16 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, UTC
 from typing import Optional, Literal
+import anyio
+import bcrypt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
-from passlib.context import CryptContext
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError as JWTError
 
 from src.database.models import User, UserRole
 from src.services.users import UserService
@@ -19,16 +24,87 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 REFRESH_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
+TOKEN_CACHE_TTL_SECONDS = 30
+
+# Built once so encode/decode don't re-encode the secret on every call.
+_JWT_KEY = settings.JWT_SECRET.encode()
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+
+
+# Maps a token digest to the (username, exp) pair decoded from it.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=TOKEN_CACHE_TTL_SECONDS)
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+# Digests of (hashed_password, plain_password) pairs checked recently. Keys
+# include the stored hash, so a password change never hits an old entry;
+# failures are still kept for just a second so retry storms collapse.
+_verified_passwords: TTLCache = TTLCache(maxsize=2048, ttl=60)
+_rejected_passwords: TTLCache = TTLCache(maxsize=2048, ttl=1)
 
 
 class Hash:
-    pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    # bcrypt is CPU-bound (~100 ms at the default cost), so it runs in a
+    # worker thread to keep the event loop responsive.
+
+    async def verify_password(self, plain_password, hashed_password):
+        key = hashlib.blake2b(
+            hashed_password.encode() + b"\x00" + plain_password.encode(),
+            digest_size=16,
+        ).digest()
+        if key in _verified_passwords:
+            return True
+        if key in _rejected_passwords:
+            return False
+        verified = await anyio.to_thread.run_sync(
+            bcrypt.checkpw, plain_password.encode(), hashed_password.encode()
+        )
+        if verified:
+            _verified_passwords[key] = True
+        else:
+            _rejected_passwords[key] = True
+        return verified
+
+    async def get_password_hash(self, password: str):
+        hashed = await anyio.to_thread.run_sync(
+            bcrypt.hashpw, password.encode(), bcrypt.gensalt()
+        )
+        return hashed.decode()
 
-    def verify_password(self, plain_password, hashed_password):
-        return self.pwd_context.verify(plain_password, hashed_password)
 
-    def get_password_hash(self, password: str):
-        return self.pwd_context.hash(password)
+_hasher = Hash()
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """
+    Check a plain password against a stored bcrypt hash.
+
+    Args:
+        plain_password (str): The password submitted by the user.
+        hashed_password (str): The stored password hash.
+
+    Returns:
+        bool: True if the password matches the hash, otherwise False.
+    """
+
+    return await _hasher.verify_password(plain_password, hashed_password)
+
+
+async def get_password_hash(password: str) -> str:
+    """
+    Hash a password for storage.
+
+    Args:
+        password (str): The plain password to hash.
+
+    Returns:
+        str: The bcrypt hash of the password.
+    """
+
+    return await _hasher.get_password_hash(password)
 
 
 def create_token(
@@ -46,13 +122,13 @@ def create_token(
         Token: The encoded JWT token.
     """
 
-    to_encode = data.copy()
     now = datetime.now(UTC)
-    expire = now + expires_delta
-    to_encode.update({"exp": expire, "iat": now, "token_type": token_type})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM
-    )
+    to_encode = data | {
+        "exp": now + expires_delta,
+        "iat": now,
+        "token_type": token_type,
+    }
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
 
@@ -112,9 +188,7 @@ async def verify_refresh_token(refresh_token: str, db: AsyncSession = Depends(ge
     """
 
     try:
-        payload = jwt.decode(
-            refresh_token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(refresh_token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         username: str = payload.get("sub")
         token_type: str = payload.get("token_type")
         if username is None or token_type != "refresh":
@@ -132,6 +206,10 @@ async def get_current_user(
     """
     Get the current user based on the provided JWT token.
 
+    Decoded tokens are cached for a short time (never past their own expiry),
+    so repeated requests with the same token skip signature verification.
+    The user itself comes from UserService's short-lived user cache.
+
     Args:
         token (str): The JWT token provided by the user.
         db (AsyncSession): The database session dependency.
@@ -146,17 +224,21 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
 
-    try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
-        username = payload["sub"]
-        if username is None:
+    key = _token_key(token)
+    cached = _token_cache.get(key)
+    if cached is not None and cached[1] > time.time():
+        username = cached[0]
+    else:
+        try:
+            payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+            username = payload["sub"]
+            if username is None:
+                raise credentials_exception
+        except JWTError as e:
             raise credentials_exception
-    except JWTError as e:
-        raise credentials_exception
+        _token_cache[key] = (username, payload["exp"])
     user_service = UserService(db)
-    user = await user_service.get_user_by_username(username)
+    user = await user_service.get_cached_user_by_username(username)
     if user is None:
         raise credentials_exception
     return user
@@ -174,9 +256,7 @@ async def get_email_from_token(token: str) -> str:
     """
 
     try:
-        payload = jwt.decode(
-            token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         email = payload["sub"]
         return email
     except JWTError as e:
@@ -197,10 +277,9 @@ def create_email_token(data: dict) -> Token:
         Token: The encoded JWT token for email verification.
     """
 
-    to_encode = data.copy()
-    expire = datetime.now(UTC) + timedelta(days=7)
-    to_encode.update({"iat": datetime.now(UTC), "exp": expire})
-    token = jwt.encode(to_encode, settings.JWT_SECRET, algorithm=settings.JWT_ALGORITHM)
+    now = datetime.now(UTC)
+    to_encode = data | {"iat": now, "exp": now + timedelta(days=7)}
+    token = jwt.encode(to_encode, _JWT_KEY, algorithm=settings.JWT_ALGORITHM)
     return token
 
 
@@ -13,16 +13,23 @@ class ContactsService:
     async def create_contact(self, user: User, body: ContactModel) -> Contact:
         return await self.repository.create_contact(user, body)
 
+    async def create_contacts(
+        self, user: User, bodies: list[ContactModel]
+    ) -> Sequence[Contact]:
+        return await self.repository.create_contacts(user, bodies)
+
     async def get_contacts(
-        self, user: User, skip: int, limit: int
+        self, user: User, skip: int, limit: int, cursor: int | None = None
     ) -> Sequence[Contact]:
-        return await self.repository.get_contacts(user, skip, limit)
+        return await self.repository.get_contacts(user, skip, limit, cursor)
 
     async def get_contact(self, user: User, contact_id: int) -> Contact | None:
         return await self.repository.get_contact_by_id(user, contact_id)
 
-    async def search_contacts(self, user: User, query: str) -> Sequence[Contact]:
-        return await self.repository.search_contacts(user, query)
+    async def search_contacts(
+        self, user: User, query: str, limit: int = 50, cursor: int | None = None
+    ) -> Sequence[Contact]:
+        return await self.repository.search_contacts(user, query, limit, cursor)
 
     async def get_birthdays_next_week(self, user: User) -> Sequence[Contact]:
         return await self.repository.get_birthdays_next_week(user)
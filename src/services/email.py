@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
@@ -9,6 +11,18 @@ from src.conf.config import settings
 from src.services.auth import create_email_token
 
 
+EMAIL_DRAIN_TIMEOUT_SECONDS = 10
+
+_email_queue: asyncio.Queue = asyncio.Queue()
+
+# Templates ship with the code, so they are compiled once and never re-checked.
+_templates = Environment(
+    loader=FileSystemLoader(Path(__file__).parent.parent / "templates"),
+    auto_reload=False,
+)
+_verify_email_template = _templates.get_template("verify_email.html")
+
+
 async def send_email(email: str, username: str, host: URL) -> None:
     """
     Send a confirmation email to the user.
@@ -29,12 +43,7 @@ async def send_email(email: str, username: str, host: URL) -> None:
 
     token_verification = create_email_token({"sub": email})
 
-    env = Environment(
-        loader=FileSystemLoader(Path(__file__).parent.parent / "templates")
-    )
-    template = env.get_template("verify_email.html")
-
-    msg_content = template.render(
+    msg_content = _verify_email_template.render(
         username=username, host=host, token=token_verification
     )
     html_message = MIMEText(msg_content, "html")
@@ -52,3 +61,58 @@ async def send_email(email: str, username: str, host: URL) -> None:
         )
     except ConnectionError as err:
         print(str(err))
+
+
+def enqueue_email(email: str, username: str, host: URL) -> None:
+    """
+    Queue a confirmation email to be sent by the email worker.
+
+    Args:
+        email (str): The email address of the user.
+        username (str): The username of the user.
+        host (URL): The host URL for the application.
+
+    Returns:
+        None
+    """
+
+    _email_queue.put_nowait((email, username, host))
+
+
+async def email_worker() -> None:
+    """
+    Send queued confirmation emails until cancelled.
+
+    Runs as a single task for the lifetime of the application, so a slow SMTP
+    server never holds up the requests that queued the emails.
+
+    Returns:
+        None
+    """
+
+    while True:
+        email, username, host = await _email_queue.get()
+        try:
+            await send_email(email, username, host)
+        except Exception as err:
+            print(str(err))
+        finally:
+            _email_queue.task_done()
+
+
+async def drain_email_queue(timeout: float = EMAIL_DRAIN_TIMEOUT_SECONDS) -> None:
+    """
+    Wait for the email worker to send everything already queued.
+
+    Called on shutdown before the worker is cancelled, so a restart does not
+    drop pending confirmation emails. Gives up after the timeout.
+
+    Args:
+        timeout (float): The maximum number of seconds to wait.
+
+    Returns:
+        None
+    """
+
+    with contextlib.suppress(TimeoutError):
+        await asyncio.wait_for(_email_queue.join(), timeout)
@@ -1,7 +1,13 @@
+from functools import partial
+
+import anyio
 import cloudinary
 import cloudinary.uploader
 
 
+UPLOAD_CHUNK_SIZE = 6_000_000
+
+
 class UploadFileService:
     def __init__(self, cloud_name, api_key, api_secret):
         """
@@ -23,7 +29,7 @@ class UploadFileService:
         )
 
     @staticmethod
-    def upload_file(file, username) -> str:
+    async def upload_file(file, username) -> str:
         """
         Create an access token for the user.
 
@@ -36,11 +42,21 @@ class UploadFileService:
         """
 
         public_id = f"RestApp/{username}"
-        r = cloudinary.uploader.upload(
-            file.file,
-            public_id=public_id,
-            tags=["user_avatar", f"user_{username}"],
-            overwrite=True,
+        # The Cloudinary SDK uploads over blocking HTTP, keep it off the event loop.
+        # upload_large streams the file in chunks instead of base64-encoding
+        # all of it in memory. Unlike upload, it defaults to resource_type="raw",
+        # so the image type has to be passed for the transformation URL below.
+        r = await anyio.to_thread.run_sync(
+            partial(
+                cloudinary.uploader.upload_large,
+                file.file,
+                chunk_size=UPLOAD_CHUNK_SIZE,
+                resource_type="image",
+                filename=file.filename,
+                public_id=public_id,
+                tags=["user_avatar", f"user_{username}"],
+                overwrite=True,
+            )
         )
         src_url = cloudinary.CloudinaryImage(public_id).build_url(
             width=250, height=250, crop="fill", version=r.get("version")
@@ -1,9 +1,22 @@
+from cachetools import TTLCache
 from pydantic import EmailStr
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.repository.users import UsersRepository
+from src.database.models import User
+from src.repository.users import AUTH_USER_COLUMNS, UsersRepository
 from src.schemas import UserCreate
 
+USER_CACHE_TTL_SECONDS = 30
+
+# AUTH_USER_COLUMNS values of recently authenticated users, keyed by username.
+_user_cache: TTLCache = TTLCache(maxsize=10000, ttl=USER_CACHE_TTL_SECONDS)
+_user_columns = [column.key for column in AUTH_USER_COLUMNS]
+
+
+def _forget_user(user: User | None) -> None:
+    if user is not None:
+        _user_cache.pop(user.username, None)
+
 
 class UserService:
     def __init__(self, db: AsyncSession):
@@ -18,8 +31,36 @@ class UserService:
     async def get_user_by_username(self, username: str):
         return await self.repository.get_user_by_username(username)
 
+    async def get_cached_user_by_username(self, username: str):
+        """
+        Load the authentication projection of a user, served from a short-lived cache.
+
+        Cache hits are merged into the current session without a query, so the
+        returned user behaves like one loaded with the same load_only options.
+
+        Args:
+            username (str): The username of the user to retrieve.
+
+        Returns:
+            User | None: The partially loaded user object if found, otherwise None.
+        """
+
+        values = _user_cache.get(username)
+        if values is None:
+            user = await self.repository.get_user_auth_projection(username)
+            if user is not None:
+                _user_cache[username] = {
+                    key: getattr(user, key) for key in _user_columns
+                }
+            return user
+
+        return await self.repository.attach_cached_user(values)
+
+    async def get_user_by_email_or_username(self, email: EmailStr, username: str):
+        return await self.repository.get_user_by_email_or_username(email, username)
+
     async def confirm_email(self, email: str):
-        return await self.repository.confirm_email(email)
+        _forget_user(await self.repository.confirm_email(email))
 
     async def update_avatar_url(self, email: str, url: str):
         return await self.repository.update_avatar_url(email, url)
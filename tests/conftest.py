@@ -1,17 +1,21 @@
-import asyncio
 import pytest
 import pytest_asyncio
-from fastapi.testclient import TestClient
+from unittest.mock import AsyncMock, Mock
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy.pool import StaticPool
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 
 from main import app
 from src.database.models import Base, User
 from src.database.db import get_db
-from src.services.auth import create_access_token, Hash
+from src.services.auth import Hash, create_access_token, get_password_hash
 
 
-SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+# In-memory, so every process (and every xdist worker) has its own database.
+# The shared cache keeps it visible to any new connection the pool opens.
+SQLALCHEMY_DATABASE_URL = (
+    "sqlite+aiosqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+)
 
 
 engine = create_async_engine(
@@ -44,29 +48,45 @@ test_admin_user = User(
 )
 
 
-@pytest.fixture(scope="module", autouse=True)
-def init_models_wrap():
-    async def init_models():
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.drop_all)
-            await conn.run_sync(Base.metadata.create_all)
-        async with TestingSessionLocal() as session:
-            hash_password = Hash().get_password_hash(test_user["password"])
-            current_user = User(
-                username=test_user["username"],
-                email=test_user["email"],
-                hashed_password=hash_password,
-                is_confirmed=True,
-                avatar="<https://twitter.com/gravatar>",
-            )
-            session.add(current_user)
-            await session.commit()
-
-    asyncio.run(init_models())
-
-
-@pytest.fixture(scope="module")
-def client():
+# bcrypt is deliberately slow and the tests reuse a few passwords, so each one
+# is hashed only once per session.
+_password_hashes: dict[str, str] = {}
+_get_password_hash = Hash.get_password_hash
+
+
+async def _memoized_get_password_hash(self, password: str) -> str:
+    if password not in _password_hashes:
+        _password_hashes[password] = await _get_password_hash(self, password)
+    return _password_hashes[password]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def memoize_password_hashing():
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Hash, "get_password_hash", _memoized_get_password_hash)
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def init_models(memoize_password_hashing):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with TestingSessionLocal() as session:
+        hash_password = await get_password_hash(test_user["password"])
+        current_user = User(
+            username=test_user["username"],
+            email=test_user["email"],
+            hashed_password=hash_password,
+            is_confirmed=True,
+            avatar="<https://twitter.com/gravatar>",
+        )
+        session.add(current_user)
+        await session.commit()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client():
     # Dependency override
 
     async def override_get_db():
@@ -79,10 +99,60 @@ def client():
 
     app.dependency_overrides[get_db] = override_get_db
 
-    yield TestClient(app)
+    # Calls the app in-process on the test loop, no TestClient thread bridge
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
 
 
 @pytest_asyncio.fixture()
 async def get_token():
     token = await create_access_token(data={"sub": test_user["username"]})
     return token
+
+
+class FakeResult:
+    """
+    The slice of Result/ScalarResult the repositories read, over a fixed list.
+
+    Stands in for MagicMock result chains, which create a child mock on every
+    attribute access.
+    """
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalar_one_or_none(self):
+        return self._rows[0] if self._rows else None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class FakeAsyncSession:
+    """
+    The slice of AsyncSession the repositories use, as plain mocks.
+
+    Much cheaper to build than AsyncMock(spec=AsyncSession), which walks the
+    whole AsyncSession class on every instantiation.
+    """
+
+    def __init__(self):
+        self.add = Mock()
+        self.execute = AsyncMock()
+        self.scalars = AsyncMock()
+        self.get = AsyncMock()
+        self.merge = AsyncMock()
+        self.commit = AsyncMock()
+        self.refresh = AsyncMock()
+        self.delete = AsyncMock()
+        self.rollback = AsyncMock()
+
+
+@pytest.fixture
+def mock_session():
+    return FakeAsyncSession()
@@ -1,11 +1,17 @@
 from unittest.mock import Mock
 import pytest
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from src.database.models import User
+from src.services.auth import create_email_token
 from tests.conftest import TestingSessionLocal
 
 
+# The register/confirm/login tests build on each other's DB state
+pytestmark = pytest.mark.xdist_group("auth_api")
+
+
 user_data = {
     "username": "samurai",
     "email": "samurai@gmail.com",
@@ -13,8 +19,9 @@ user_data = {
 }
 
 
-def test_register_user(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_register_user(client):
+    response = await client.post(
         "/api/auth/register",
         json={
             "username": "nick",
@@ -25,10 +32,11 @@ def test_register_user(client):
     assert response.status_code == 201
 
 
-def test_register(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+@pytest.mark.asyncio
+async def test_register(client, monkeypatch):
+    mock_enqueue_email = Mock()
+    monkeypatch.setattr("src.api.auth.enqueue_email", mock_enqueue_email)
+    response = await client.post("api/auth/register", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
     assert data["username"] == user_data["username"]
@@ -36,17 +44,40 @@ def test_register(client, monkeypatch):
     assert "hashed_password" not in data
 
 
-def test_repeat_register(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+@pytest.mark.asyncio
+async def test_repeat_register(client, monkeypatch):
+    mock_enqueue_email = Mock()
+    monkeypatch.setattr("src.api.auth.enqueue_email", mock_enqueue_email)
+    response = await client.post("api/auth/register", json=user_data)
     assert response.status_code == 409, response.text
     data = response.json()
     assert data["detail"] == "User already exists"
 
 
-def test_not_confirmed_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_repeat_register_other_case(client, monkeypatch):
+    mock_enqueue_email = Mock()
+    monkeypatch.setattr("src.api.auth.enqueue_email", mock_enqueue_email)
+    response = await client.post(
+        "api/auth/register",
+        json={**user_data, "username": "ronin", "email": "Samurai@Gmail.com"},
+    )
+    assert response.status_code == 409, response.text
+
+
+@pytest.mark.asyncio
+async def test_email_unique_ignoring_case():
+    async with TestingSessionLocal() as session:
+        session.add(
+            User(username="ronin", email="SAMURAI@gmail.com", hashed_password="x")
+        )
+        with pytest.raises(IntegrityError):
+            await session.commit()
+
+
+@pytest.mark.asyncio
+async def test_not_confirmed_login(client):
+    response = await client.post(
         "api/auth/login",
         data={
             "username": user_data.get("username"),
@@ -58,6 +89,17 @@ def test_not_confirmed_login(client):
     assert data["detail"] == "Email is not confirmed"
 
 
+@pytest.mark.asyncio
+async def test_confirm_email(client):
+    token = create_email_token({"sub": user_data.get("email")})
+    response = await client.get(f"api/auth/confirm_email/{token}")
+    assert response.status_code == 200, response.text
+    assert response.json()["message"] == "Email confirmed"
+
+    response = await client.get(f"api/auth/confirm_email/{token}")
+    assert response.json()["message"] == "Email already confirmed"
+
+
 @pytest.mark.asyncio
 async def test_login(client):
     async with TestingSessionLocal() as session:
@@ -69,7 +111,7 @@ async def test_login(client):
             current_user.is_confirmed = True
             await session.commit()
 
-        response = client.post(
+        response = await client.post(
             "api/auth/login",
             data={
                 "username": user_data.get("username"),
@@ -91,7 +133,7 @@ async def test_refresh_token(client):
         )
         current_user = current_user.scalar_one_or_none()
         print(current_user)
-        response = client.post(
+        response = await client.post(
             "api/auth/refresh_token",
             json={
                 "refresh_token": current_user.refresh_token,
@@ -103,8 +145,9 @@ async def test_refresh_token(client):
         assert "token_type" in data
 
 
-def test_wrong_password_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_wrong_password_login(client):
+    response = await client.post(
         "api/auth/login",
         data={"username": user_data.get("username"), "password": "password"},
     )
@@ -113,8 +156,9 @@ def test_wrong_password_login(client):
     assert data["detail"] == "Invalid credentials"
 
 
-def test_wrong_username_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_wrong_username_login(client):
+    response = await client.post(
         "api/auth/login",
         data={"username": "username", "password": user_data.get("password")},
     )
@@ -123,10 +167,29 @@ def test_wrong_username_login(client):
     assert data["detail"] == "Invalid credentials"
 
 
-def test_validation_error_login(client):
-    response = client.post(
+@pytest.mark.asyncio
+async def test_validation_error_login(client):
+    response = await client.post(
         "api/auth/login", data={"password": user_data.get("password")}
     )
     assert response.status_code == 422, response.text
     data = response.json()
     assert "detail" in data
+
+
+@pytest.mark.asyncio
+async def test_request_email_unknown_user(client, monkeypatch):
+    mock_enqueue_email = Mock()
+    monkeypatch.setattr("src.api.auth.enqueue_email", mock_enqueue_email)
+    response = await client.post(
+        "api/auth/request_email", json={"email": "nobody@example.com"}
+    )
+    assert response.status_code == 200, response.text
+    mock_enqueue_email.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_read_public(client):
+    response = await client.get("api/auth/public")
+    assert response.status_code == 200, response.text
+    assert "message" in response.json()
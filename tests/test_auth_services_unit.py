@@ -0,0 +1,39 @@
+from unittest.mock import Mock
+
+import bcrypt
+import pytest
+
+from src.services import auth
+from src.services.auth import verify_password
+
+
+@pytest.fixture
+def hashed_password():
+    return bcrypt.hashpw(b"secret", bcrypt.gensalt(rounds=4)).decode()
+
+
+@pytest.fixture
+def checkpw(monkeypatch):
+    mock_checkpw = Mock(wraps=bcrypt.checkpw)
+    monkeypatch.setattr(auth.bcrypt, "checkpw", mock_checkpw)
+    return mock_checkpw
+
+
+@pytest.mark.asyncio
+async def test_verify_password_caches_success(hashed_password, checkpw):
+    assert await verify_password("secret", hashed_password) is True
+    assert await verify_password("secret", hashed_password) is True
+    checkpw.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_verify_password_caches_failure_briefly(
+    hashed_password, checkpw, monkeypatch
+):
+    assert await verify_password("wrong", hashed_password) is False
+    assert await verify_password("wrong", hashed_password) is False
+    checkpw.assert_called_once()
+
+    monkeypatch.setattr(auth, "_rejected_passwords", {})
+    assert await verify_password("wrong", hashed_password) is False
+    assert checkpw.call_count == 2
@@ -0,0 +1,78 @@
+import pytest
+
+
+# The read/search tests rely on the contact created by test_create_contact
+pytestmark = pytest.mark.xdist_group("contacts_api")
+
+
+contact_data = {
+    "first_name": "Wade",
+    "last_name": "Wilson",
+    "email": "wade@example.com",
+    "phone": "1234567890",
+    "birth_date": "1991-02-01",
+    "description": "Merc with a mouth",
+}
+
+
+@pytest.mark.asyncio
+async def test_create_contact(client, get_token):
+    response = await client.post(
+        "api/contacts/",
+        json=contact_data,
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 201, response.text
+    data = response.json()
+    assert data["email"] == contact_data["email"]
+    assert "id" in data
+
+
+@pytest.mark.asyncio
+async def test_create_contact_invalid_email(client, get_token):
+    response = await client.post(
+        "api/contacts/",
+        json={**contact_data, "email": "not-an-email"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 422, response.text
+
+
+@pytest.mark.asyncio
+async def test_read_contacts(client, get_token):
+    response = await client.get(
+        "api/contacts/", headers={"Authorization": f"Bearer {get_token}"}
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert [contact["email"] for contact in data] == [contact_data["email"]]
+    assert data[0]["birth_date"] == contact_data["birth_date"]
+
+
+@pytest.mark.asyncio
+async def test_search_contacts(client, get_token):
+    response = await client.get(
+        "api/contacts/search/",
+        params={"query": "wilson"},
+        headers={"Authorization": f"Bearer {get_token}"},
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()[0]["last_name"] == contact_data["last_name"]
+
+
+@pytest.mark.asyncio
+async def test_read_contacts_after_cursor(client, get_token):
+    headers = {"Authorization": f"Bearer {get_token}"}
+    first = (await client.get("api/contacts/", headers=headers)).json()[0]
+
+    response = await client.get(
+        "api/contacts/", params={"cursor": first["id"]}, headers=headers
+    )
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_read_contacts_unauthorized(client):
+    response = await client.get("api/contacts/")
+    assert response.status_code == 401, response.text
@@ -1,17 +1,11 @@
 from datetime import datetime
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import AsyncMock
 
 from src.database.models import Contact, User
 from src.repository.contacts import ContactsRepository
 from src.schemas import ContactModel
-
-
-@pytest.fixture
-def mock_session():
-    mock_session = AsyncMock(spec=AsyncSession)
-    return mock_session
+from tests.conftest import FakeResult
 
 
 @pytest.fixture
@@ -24,14 +18,28 @@ def user():
     return User(id=1, username="testuser")
 
 
+@pytest.fixture(scope="module")
+def new_contact():
+    return ContactModel(
+        email="foo@bar.com",
+        first_name="Paul",
+        last_name="Smith",
+        phone="222-222-2222",
+        birth_date=datetime(day=5, month=7, year=1990),
+    )
+
+
+@pytest.fixture(scope="module")
+def contact_update():
+    return ContactModel(first_name="Nick", last_name="Owens", email="foo@bar.com")
+
+
 @pytest.mark.asyncio
 async def test_get_contacts(contact_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [
-        Contact(first_name="Paul", user=user)
-    ]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult(
+        [Contact(first_name="Paul", user=user)]
+    )
 
     # Call method
     contacts = await contact_repository.get_contacts(skip=0, limit=10, user=user)
@@ -43,14 +51,27 @@ async def test_get_contacts(contact_repository, mock_session, user):
         assert contact.first_name == "Paul"
 
 
+@pytest.mark.asyncio
+async def test_get_contacts_with_cursor(contact_repository, mock_session, user):
+    # Setup mock
+    mock_session.execute.return_value = FakeResult([])
+
+    # Call method
+    await contact_repository.get_contacts(user=user, skip=20, limit=10, cursor=42)
+
+    # Assertions
+    stmt = mock_session.execute.await_args.args[0]
+    sql = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+    assert "contacts.id > 42" in sql
+    assert "OFFSET" not in sql
+
+
 @pytest.mark.asyncio
 async def test_get_contact_by_id(contact_repository, mock_session, user):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
-        id=1, first_name="Paul", user=user
+    mock_session.get = AsyncMock(
+        return_value=Contact(id=1, first_name="Paul", user_id=user.id, user=user)
     )
-    mock_session.execute = AsyncMock(return_value=mock_result)
 
     # Call method
     contact = await contact_repository.get_contact_by_id(contact_id=1, user=user)
@@ -62,17 +83,69 @@ async def test_get_contact_by_id(contact_repository, mock_session, user):
 
 
 @pytest.mark.asyncio
-async def test_create_contact(contact_repository, mock_session, user):
-    contact_data = ContactModel(
-        email="foo@bar.com",
-        first_name="Paul",
-        last_name="Smith",
-        phone="222-222-2222",
-        birth_date=datetime(day=5, month=7, year=1990),
+async def test_get_contact_by_id_other_user(contact_repository, mock_session, user):
+    # Setup mock
+    mock_session.get = AsyncMock(
+        return_value=Contact(id=1, first_name="Paul", user_id=user.id + 1)
     )
 
     # Call method
-    created_contact = await contact_repository.create_contact(user, contact_data)
+    contact = await contact_repository.get_contact_by_id(contact_id=1, user=user)
+
+    # Assertions
+    assert contact is None
+
+
+@pytest.mark.asyncio
+async def test_search_contacts_escapes_wildcards(
+    contact_repository, mock_session, user
+):
+    # Setup mock
+    mock_session.execute.return_value = FakeResult([])
+
+    # Call method
+    await contact_repository.search_contacts(user, "50%_off")
+
+    # Assertions
+    stmt = mock_session.execute.await_args.args[0]
+    assert "%50\\%\\_off%" in stmt.compile().params.values()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "today, expected",
+    [
+        (datetime(2024, 6, 10), "contacts.birth_md BETWEEN 610 AND 617"),
+        (
+            datetime(2024, 12, 28),
+            "contacts.birth_md >= 1228 OR contacts.birth_md <= 104",
+        ),
+    ],
+)
+async def test_get_birthdays_next_week(
+    contact_repository, mock_session, user, monkeypatch, today, expected
+):
+    # Setup mock
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return today
+
+    monkeypatch.setattr("src.repository.contacts.datetime", FrozenDatetime)
+    mock_session.execute.return_value = FakeResult([])
+
+    # Call method
+    await contact_repository.get_birthdays_next_week(user)
+
+    # Assertions
+    stmt = mock_session.execute.await_args.args[0]
+    assert expected in str(stmt.compile(compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.asyncio
+async def test_create_contact(contact_repository, mock_session, user, new_contact):
+    # Call method
+    created_contact = await contact_repository.create_contact(user, new_contact)
 
     # Assertions
     assert created_contact is not None
@@ -84,36 +157,65 @@ async def test_create_contact(contact_repository, mock_session, user):
 
 
 @pytest.mark.asyncio
-async def test_update_contact(contact_repository, mock_session, user):
+async def test_create_contacts(contact_repository, mock_session, user):
+    bodies = [
+        ContactModel(
+            email=f"{name.lower()}@bar.com",
+            first_name=name,
+            last_name="Smith",
+            phone="222-222-2222",
+            birth_date=datetime(day=5, month=7, year=1990),
+        )
+        for name in ("Paul", "Anna")
+    ]
+    mock_session.scalars.return_value = FakeResult(
+        [
+            Contact(id=i, first_name=body.first_name, user_id=user.id)
+            for i, body in enumerate(bodies, start=1)
+        ]
+    )
+
+    # Call method
+    contacts = await contact_repository.create_contacts(user, bodies)
+
+    # Assertions
+    assert [contact.first_name for contact in contacts] == ["Paul", "Anna"]
+    values = mock_session.scalars.await_args.args[1]
+    assert [row["user_id"] for row in values] == [user.id, user.id]
+    mock_session.scalars.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+    mock_session.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_update_contact(contact_repository, mock_session, user, contact_update):
     # Setup
-    contact_data = ContactModel(
-        first_name="Nick", last_name="Owens", email="foo@bar.com"
+    updated_contact = Contact(
+        id=1, first_name="Nick", last_name="Owens", user_id=user.id, user=user
     )
-    existing_contact = Contact(id=1, first_name="Paul", last_name="Smith", user=user)
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult([updated_contact])
 
     # Call method
     result = await contact_repository.update_contact(
-        user=user, contact_id=1, body=contact_data
+        user=user, contact_id=1, body=contact_update
     )
 
     # Assertions
     assert result is not None
     assert result.first_name == "Nick"
     assert result.last_name == "Owens"
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    mock_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_remove_contact(contact_repository, mock_session, user):
     # Setup
-    existing_contact = Contact(id=1, first_name="Paul", last_name="Owens", user=user)
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    existing_contact = Contact(
+        id=1, first_name="Paul", last_name="Owens", user_id=user.id, user=user
+    )
+    mock_session.execute.return_value = FakeResult([existing_contact])
 
     # Call method
     result = await contact_repository.remove_contact(contact_id=1, user=user)
@@ -121,5 +223,6 @@ async def test_remove_contact(contact_repository, mock_session, user):
     # Assertions
     assert result is not None
     assert result.last_name == "Owens"
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_awaited()
     mock_session.commit.assert_awaited_once()
@@ -1,16 +1,11 @@
 from datetime import datetime
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
+from unittest.mock import AsyncMock
 
 from src.database.models import Contact, User
 from src.repository.contacts import ContactsRepository
 from src.schemas import ContactModel
-
-
-@pytest.fixture
-def mock_session():
-    return AsyncMock(spec=AsyncSession)
+from tests.conftest import FakeResult
 
 
 @pytest.fixture
@@ -23,13 +18,30 @@ def user():
     return User(id=1, username="testuser")
 
 
+@pytest.fixture(scope="module")
+def new_contact():
+    return ContactModel(
+        email="sky@walker.com",
+        first_name="Luke",
+        last_name="Skywalker",
+        phone="40358974",
+        birth_date=datetime(day=25, month=2, year=1999),
+        description="",
+    )
+
+
+@pytest.fixture(scope="module")
+def contact_update():
+    return ContactModel(
+        first_name="Mike", last_name="Skywalker", email="sky@walker.com"
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_contacts(contact_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [
-        Contact(first_name="Luke", user=user)
-    ]
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult(
+        [Contact(first_name="Luke", user=user)]
+    )
 
     contacts = await contact_repository.get_contacts(skip=0, limit=10, user=user)
 
@@ -40,11 +52,9 @@ async def test_get_contacts(contact_repository, mock_session, user):
 
 @pytest.mark.asyncio
 async def test_get_contact_by_id(contact_repository, mock_session, user):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = Contact(
-        id=1, first_name="Luke", user=user
+    mock_session.get = AsyncMock(
+        return_value=Contact(id=1, first_name="Luke", user_id=user.id, user=user)
     )
-    mock_session.execute = AsyncMock(return_value=mock_result)
 
     contact = await contact_repository.get_contact_by_id(contact_id=1, user=user)
 
@@ -54,18 +64,9 @@ async def test_get_contact_by_id(contact_repository, mock_session, user):
 
 
 @pytest.mark.asyncio
-async def test_create_contact(contact_repository, mock_session, user):
-    contact_data = ContactModel(
-        email="sky@walker.com",
-        first_name="Luke",
-        last_name="Skywalker",
-        phone="40358974",
-        birth_date=datetime(day=25, month=2, year=1999),
-        description="",
-    )
-
+async def test_create_contact(contact_repository, mock_session, user, new_contact):
     created_contact = await contact_repository.create_contact(
-        user=user, body=contact_data
+        user=user, body=new_contact
     )
 
     assert created_contact is not None
@@ -77,38 +78,37 @@ async def test_create_contact(contact_repository, mock_session, user):
 
 
 @pytest.mark.asyncio
-async def test_update_contact(contact_repository, mock_session, user):
-    contact_data = ContactModel(
-        first_name="Mike", last_name="Skywalker", email="sky@walker.com"
+async def test_update_contact(contact_repository, mock_session, user, contact_update):
+    updated_contact = Contact(
+        id=1, first_name="Mike", last_name="Skywalker", user_id=user.id, user=user
     )
-    existing_contact = Contact(id=1, first_name="Luke", last_name="Oldman", user=user)
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult([updated_contact])
 
     result = await contact_repository.update_contact(
-        user=user, contact_id=1, body=contact_data
+        user=user, contact_id=1, body=contact_update
     )
 
     assert result is not None
     assert result.first_name == "Mike"
     assert result.last_name == "Skywalker"
+    mock_session.execute.assert_awaited_once()
     mock_session.commit.assert_awaited_once()
-    mock_session.refresh.assert_awaited_once_with(existing_contact)
+    mock_session.refresh.assert_not_awaited()
 
 
 @pytest.mark.asyncio
 async def test_remove_contact(contact_repository, mock_session, user):
-    existing_contact = Contact(id=1, first_name="Luke", last_name="Oldman", user=user)
+    existing_contact = Contact(
+        id=1, first_name="Luke", last_name="Oldman", user_id=user.id, user=user
+    )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_contact
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult([existing_contact])
 
     result = await contact_repository.remove_contact(contact_id=1, user=user)
 
     assert result is not None
     assert result.last_name == "Oldman"
-    mock_session.delete.assert_awaited_once_with(existing_contact)
+    mock_session.execute.assert_awaited_once()
+    mock_session.delete.assert_not_awaited()
     mock_session.commit.assert_awaited_once()
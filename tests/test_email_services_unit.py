@@ -0,0 +1,49 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from main import app, lifespan
+from src.services import email
+from src.services.email import drain_email_queue, email_worker, enqueue_email
+
+
+@pytest.fixture
+def send_email(monkeypatch):
+    # A fresh queue, so nothing queued by other tests gets sent here
+    monkeypatch.setattr(email, "_email_queue", asyncio.Queue())
+    mock_send_email = AsyncMock()
+    monkeypatch.setattr(email, "send_email", mock_send_email)
+    return mock_send_email
+
+
+@pytest.mark.asyncio
+async def test_email_worker_sends_queued_email(send_email):
+    worker = asyncio.create_task(email_worker())
+
+    enqueue_email("foo@bar.com", "testuser", "http://test/")
+    await drain_email_queue(timeout=1)
+
+    send_email.assert_awaited_once_with("foo@bar.com", "testuser", "http://test/")
+    worker.cancel()
+
+
+@pytest.mark.asyncio
+async def test_email_worker_keeps_going_after_failure(send_email):
+    send_email.side_effect = [ConnectionError("smtp down"), None]
+    worker = asyncio.create_task(email_worker())
+
+    enqueue_email("foo@bar.com", "first", "http://test/")
+    enqueue_email("foo@bar.com", "second", "http://test/")
+    await drain_email_queue(timeout=1)
+
+    assert send_email.await_count == 2
+    worker.cancel()
+
+
+@pytest.mark.asyncio
+async def test_shutdown_sends_pending_emails(send_email):
+    async with lifespan(app):
+        enqueue_email("foo@bar.com", "testuser", "http://test/")
+
+    send_email.assert_awaited_once_with("foo@bar.com", "testuser", "http://test/")
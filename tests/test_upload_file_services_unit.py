@@ -0,0 +1,43 @@
+import io
+import threading
+from unittest.mock import Mock
+
+import pytest
+from fastapi import UploadFile
+
+from src.services import upload_file
+from src.services.upload_file import UPLOAD_CHUNK_SIZE, UploadFileService
+
+
+@pytest.fixture
+def upload_large(monkeypatch):
+    calling_threads = []
+
+    def fake_upload_large(*args, **kwargs):
+        calling_threads.append(threading.current_thread())
+        return {"version": 123}
+
+    mock_upload_large = Mock(side_effect=fake_upload_large)
+    mock_upload_large.calling_threads = calling_threads
+    monkeypatch.setattr(
+        upload_file.cloudinary.uploader, "upload_large", mock_upload_large
+    )
+    return mock_upload_large
+
+
+@pytest.mark.asyncio
+async def test_upload_file(upload_large):
+    file = UploadFile(io.BytesIO(b"avatar image data"), filename="avatar.png")
+
+    url = await UploadFileService("cloud", "key", "secret").upload_file(
+        file, "testuser"
+    )
+
+    upload_large.assert_called_once()
+    args, kwargs = upload_large.call_args
+    assert args == (file.file,)
+    assert kwargs["resource_type"] == "image"
+    assert kwargs["chunk_size"] == UPLOAD_CHUNK_SIZE
+    assert kwargs["public_id"] == "RestApp/testuser"
+    assert upload_large.calling_threads[0] is not threading.main_thread()
+    assert "/image/upload/c_fill,h_250,w_250/v123/RestApp/testuser" in url
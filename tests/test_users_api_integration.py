@@ -1,12 +1,20 @@
 import io
-from unittest.mock import Mock, patch, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
 import pytest
+import pytest_asyncio
 from sqlalchemy import select
 
 from src.database.models import User
+from src.services.upload_file import UploadFileService
+from src.services.users import UserService
 from tests.conftest import TestingSessionLocal, test_admin_user
 
 
+# register -> login -> me/avatar share the agent007 row, keep them on one worker
+pytestmark = pytest.mark.xdist_group("auth_flow")
+
+
 user_data = {
     "username": "agent007",
     "email": "agent007@gmail.com",
@@ -15,10 +23,11 @@ user_data = {
 }
 
 
-def test_register(client, monkeypatch):
-    mock_send_email = Mock()
-    monkeypatch.setattr("src.api.auth.send_email", mock_send_email)
-    response = client.post("api/auth/register", json=user_data)
+@pytest.mark.asyncio
+async def test_register(client, monkeypatch):
+    mock_enqueue_email = Mock()
+    monkeypatch.setattr("src.api.auth.enqueue_email", mock_enqueue_email)
+    response = await client.post("api/auth/register", json=user_data)
     assert response.status_code == 201, response.text
     data = response.json()
     assert data["username"] == user_data["username"]
@@ -26,8 +35,7 @@ def test_register(client, monkeypatch):
     assert "hashed_password" not in data
 
 
-@pytest.mark.asyncio
-async def test_login(client):
+async def login(client):
     async with TestingSessionLocal() as session:
         current_user = await session.execute(
             select(User).filter_by(email=user_data.get("email"))
@@ -37,49 +45,67 @@ async def test_login(client):
             current_user.is_confirmed = True
             await session.commit()
 
-    response = client.post(
+    return await client.post(
         "api/auth/login",
         data={
             "username": user_data.get("username"),
             "password": user_data.get("password"),
         },
     )
+
+
+@pytest_asyncio.fixture(scope="module")
+async def auth_token(client):
+    response = await login(client)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+@pytest.mark.asyncio
+async def test_login(client):
+    response = await login(client)
     assert response.status_code == 200, response.text
     data = response.json()
     assert "access_token" in data
     assert "token_type" in data
-    return data
 
 
 @pytest.mark.asyncio
-async def test_get_me(client):
-    response = await test_login(client)
-    token = response.get("access_token")
-    response = client.get("/api/users/me", headers={"Authorization": f"Bearer {token}"})
+async def test_get_me(client, auth_token):
+    token = auth_token.get("access_token")
+    response = await client.get(
+        "/api/users/me", headers={"Authorization": f"Bearer {token}"}
+    )
 
     assert response.status_code == 200 or response.status_code == 405
 
 
+@pytest.fixture(scope="module")
+def avatar_mocks():
+    """Patch out the avatar upload and its DB write for this module's tests."""
+    mocks = SimpleNamespace(
+        update_avatar_url=AsyncMock(return_value=test_admin_user),
+        upload_file=AsyncMock(return_value="https://fake-avatar-url.com/avatar.png"),
+    )
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(UserService, "update_avatar_url", mocks.update_avatar_url)
+        mp.setattr(UploadFileService, "upload_file", mocks.upload_file)
+        yield mocks
+
+
 @pytest.mark.asyncio
-async def test_update_avatar(client):
-    token_object = await test_login(client)
-    token = token_object.get("access_token")
-
-    with patch(
-        "src.api.users.UserService.update_avatar_url", new_callable=AsyncMock
-    ) as mock_update_avatar:
-        mock_update_avatar.return_value = test_admin_user
-        with patch(
-            "src.api.users.UploadFileService.upload_file", new_callable=Mock
-        ) as mock_upload:
-            mock_upload.return_value = "https://fake-avatar-url.com/avatar.png"
-
-            fake_file = io.BytesIO(b"avatar image data")
-            fake_file.name = "avatar.png"
-
-            response = client.patch(
-                "/api/users/avatar",
-                headers={"Authorization": f"Bearer {token}"},
-                files={"file": ("avatar.png", fake_file, "image/png")},
-            )
-            assert response.status_code == 200
+async def test_update_avatar(client, auth_token, avatar_mocks):
+    token = auth_token.get("access_token")
+
+    fake_file = io.BytesIO(b"avatar image data")
+    fake_file.name = "avatar.png"
+
+    response = await client.patch(
+        "/api/users/avatar",
+        headers={"Authorization": f"Bearer {token}"},
+        files={"file": ("avatar.png", fake_file, "image/png")},
+    )
+    assert response.status_code == 200
+    avatar_mocks.update_avatar_url.assert_awaited_once_with(
+        user_data["email"], "https://fake-avatar-url.com/avatar.png"
+    )
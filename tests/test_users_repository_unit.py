@@ -1,16 +1,15 @@
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.schemas import UserCreate
 from src.database.models import Contact, User
 from src.repository.users import UsersRepository
+from tests.conftest import FakeResult
 
 
-@pytest.fixture
-def mock_session():
-    mock_session = AsyncMock(spec=AsyncSession)
-    return mock_session
+# Lookup results the repository only hands back, never modifies
+USER_PAUL = User(id=1, username="Paul")
+USER_BILL = User(id=1, username="Bill")
+USER_FOO = User(id=1, email="foo@bar.com")
 
 
 @pytest.fixture
@@ -23,12 +22,19 @@ def contact():
     return Contact(id=1, email="sky@walker.com")
 
 
+@pytest.fixture(scope="module")
+def new_user():
+    return UserCreate(
+        username="testuser",
+        email="test@example.com",
+        password="hashed_password",
+    )
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_id(user_repository, mock_session):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = User(id=1, username="Paul")
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult([USER_PAUL])
 
     # Call method
     user = await user_repository.get_user_by_id(user_id=1)
@@ -41,9 +47,7 @@ async def test_get_user_by_id(user_repository, mock_session):
 @pytest.mark.asyncio
 async def test_get_user_by_username(user_repository, mock_session):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = User(id=1, username="Bill")
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult([USER_BILL])
 
     # Call method
     user = await user_repository.get_user_by_username(username="Bill")
@@ -53,12 +57,27 @@ async def test_get_user_by_username(user_repository, mock_session):
     assert user.username == "Bill"
 
 
+@pytest.mark.asyncio
+async def test_get_user_auth_projection(user_repository, mock_session):
+    # Setup mock
+    mock_session.execute.return_value = FakeResult([USER_BILL])
+
+    # Call method
+    user = await user_repository.get_user_auth_projection(username="Bill")
+    # Assertions
+    assert user is not None
+    assert user.username == "Bill"
+    stmt = mock_session.execute.await_args.args[0]
+    sql = str(stmt.compile())
+    assert "users.email" in sql
+    assert "hashed_password" not in sql
+    assert "refresh_token" not in sql
+
+
 @pytest.mark.asyncio
 async def test_get_user_by_email(user_repository, mock_session):
     # Setup mock
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = User(id=1, email="foo@bar.com")
-    mock_session.execute = AsyncMock(return_value=mock_result)
+    mock_session.execute.return_value = FakeResult([USER_FOO])
 
     # Call method
     user = await user_repository.get_user_by_email(email="foo@bar.com")
@@ -69,15 +88,24 @@ async def test_get_user_by_email(user_repository, mock_session):
 
 
 @pytest.mark.asyncio
-async def test_create_user(user_repository, mock_session):
-    user_data = UserCreate(
-        username="testuser",
-        email="test@example.com",
-        password="hashed_password",
+async def test_get_user_by_email_or_username(user_repository, mock_session):
+    # Setup mock
+    mock_session.execute.return_value = FakeResult([USER_BILL])
+
+    # Call method
+    user = await user_repository.get_user_by_email_or_username(
+        email="foo@bar.com", username="Bill"
     )
+    # Assertions
+    assert user is not None
+    assert user.username == "Bill"
+    mock_session.execute.assert_awaited_once()
 
+
+@pytest.mark.asyncio
+async def test_create_user(user_repository, mock_session, new_user):
     # Call method
-    created_user = await user_repository.create_user(user_data)
+    created_user = await user_repository.create_user(new_user)
 
     # Assertions
     assert created_user is not None
@@ -86,3 +114,50 @@ async def test_create_user(user_repository, mock_session):
     assert created_user.email == "test@example.com"
     mock_session.commit.assert_awaited_once()
     mock_session.refresh.assert_awaited_once_with(created_user)
+
+
+@pytest.mark.asyncio
+async def test_confirm_email(user_repository, mock_session):
+    # Setup mock
+    mock_session.execute.return_value = FakeResult(
+        [User(id=1, email="foo@bar.com", is_confirmed=True)]
+    )
+
+    # Call method
+    user = await user_repository.confirm_email("Foo@Bar.com")
+
+    # Assertions
+    assert user.is_confirmed is True
+    mock_session.execute.assert_awaited_once()
+    mock_session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_update_avatar_url_missing_user(user_repository, mock_session):
+    # Setup mock
+    mock_session.execute.return_value = FakeResult([])
+
+    # Call method
+    user = await user_repository.update_avatar_url("nobody@bar.com", "http://url")
+
+    # Assertions
+    assert user is None
+    mock_session.execute.assert_awaited_once()
+    mock_session.refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_attach_cached_user(user_repository, mock_session):
+    # Setup mock
+    mock_session.merge.side_effect = lambda user, load: user
+
+    # Call method
+    user = await user_repository.attach_cached_user(
+        {"id": 1, "username": "Bill", "email": "foo@bar.com"}
+    )
+
+    # Assertions
+    assert user.id == 1
+    assert user.username == "Bill"
+    mock_session.merge.assert_awaited_once_with(user, load=False)
+    mock_session.execute.assert_not_awaited()
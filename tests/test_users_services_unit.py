@@ -18,15 +18,16 @@ def user_service(mock_repository):
     return service
 
 
-@pytest.mark.asyncio
-async def test_create_user(user_service, mock_repository):
-    user_data = UserCreate(
-        username="testuser", email="test@example.com", password="secret"
-    )
+@pytest.fixture(scope="module")
+def new_user():
+    return UserCreate(username="testuser", email="test@example.com", password="secret")
+
 
+@pytest.mark.asyncio
+async def test_create_user(user_service, mock_repository, new_user):
     mock_repository.create_user = AsyncMock(return_value=User(username="testuser"))
 
-    result = await user_service.create_user(user_data)
+    result = await user_service.create_user(new_user)
 
     assert isinstance(result, User)
     assert result.username == "testuser"
@@ -54,6 +55,20 @@ async def test_get_user_by_email(user_service, mock_repository):
     mock_repository.get_user_by_email.assert_awaited_once_with(email)
 
 
+@pytest.mark.asyncio
+async def test_get_user_by_email_or_username(user_service, mock_repository):
+    email = "test@example.com"
+    mock_repository.get_user_by_email_or_username = AsyncMock(
+        return_value=User(email=email, username="testuser")
+    )
+    user = await user_service.get_user_by_email_or_username(email, "testuser")
+
+    assert user.email == email
+    mock_repository.get_user_by_email_or_username.assert_awaited_once_with(
+        email, "testuser"
+    )
+
+
 @pytest.mark.asyncio
 async def test_update_avatar_url(user_service, mock_repository):
     email = "test@example.com"
@@ -66,3 +81,33 @@ async def test_update_avatar_url(user_service, mock_repository):
 
     assert user.avatar == url
     mock_repository.update_avatar_url.assert_awaited_once_with(email, url)
+
+
+@pytest.mark.asyncio
+async def test_get_cached_user_by_username(user_service, mock_repository):
+    mock_repository.get_user_auth_projection = AsyncMock(
+        return_value=User(
+            id=42,
+            username="cacheduser",
+            email="cached@example.com",
+            role="user",
+            is_confirmed=True,
+        )
+    )
+    mock_repository.attach_cached_user = AsyncMock(
+        side_effect=lambda values: User(**values)
+    )
+
+    first = await user_service.get_cached_user_by_username("cacheduser")
+    second = await user_service.get_cached_user_by_username("cacheduser")
+
+    assert first.id == second.id == 42
+    assert second.email == "cached@example.com"
+    mock_repository.get_user_auth_projection.assert_awaited_once_with("cacheduser")
+    mock_repository.attach_cached_user.assert_awaited_once()
+
+    mock_repository.confirm_email = AsyncMock(return_value=first)
+    await user_service.confirm_email(first.email)
+    await user_service.get_cached_user_by_username("cacheduser")
+
+    assert mock_repository.get_user_auth_projection.await_count == 2
@@ -0,0 +1,22 @@
+from unittest.mock import patch
+import pytest
+
+from src.api import utils
+
+
+@pytest.mark.asyncio
+async def test_healthchecker(client):
+    utils._last_health_check = (float("-inf"), None)
+    response = await client.get("api/healthchecker")
+    assert response.status_code == 200, response.text
+    assert response.json() == {"message": "Welcome to FastAPI!"}
+
+
+@pytest.mark.asyncio
+async def test_healthchecker_uses_cached_result(client):
+    utils._last_health_check = (float("-inf"), None)
+    await client.get("api/healthchecker")
+
+    with patch("src.api.utils.text", side_effect=AssertionError):
+        response = await client.get("api/healthchecker")
+    assert response.status_code == 200, response.text